@@ -12,6 +12,12 @@ class AsyncContext:
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.close()
 
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
     def __del__(self):
         self.close()
 
@@ -22,5 +28,16 @@ class AsyncContext:
         except RuntimeError:
             pass
 
+    async def aclose(self):
+        """Close and also release resources that need the event loop"""
+        self.close()
+
     def _add_task(self, task):
         self._tasks.append(task)
+        task.add_done_callback(self._remove_task)
+
+    def _remove_task(self, task):
+        try:
+            self._tasks.remove(task)
+        except ValueError:
+            pass
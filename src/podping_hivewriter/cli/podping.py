@@ -59,6 +59,27 @@ def iris_callback(iris: List[str]) -> List[str]:
     return iris
 
 
+def install_uvloop() -> None:
+    """Use uvloop for the event loop if it's installed.  Skipped when a loop is
+    already running (eg. under pytest) since we don't own that loop."""
+    try:
+        asyncio.get_running_loop()
+        return
+    except RuntimeError:
+        pass
+
+    if sys.platform == "win32":
+        return
+
+    try:
+        import uvloop
+    except ImportError:
+        return
+
+    uvloop.install()
+    logging.debug("Using uvloop event loop")
+
+
 def version_callback(value: bool):
     if value:
         typer.echo(__version__)
@@ -142,9 +163,19 @@ def write(
         daemon=False,
         dry_run=Config.dry_run,
     ) as podping_hivewriter:
-        coro = podping_hivewriter.failure_retry(
-            set(iris), medium=Config.medium, reason=Config.reason
-        )
+
+        async def write_iris():
+            try:
+                # Dedupe while keeping the order given on the command line
+                return await podping_hivewriter.failure_retry(
+                    list(dict.fromkeys(iris)),
+                    medium=Config.medium,
+                    reason=Config.reason,
+                )
+            finally:
+                await podping_hivewriter.aclose()
+
+        coro = write_iris()
         try:
             # Try to get an existing loop in case of running from other program
             # Mostly used for pytest
@@ -246,7 +277,10 @@ def server(
     except RuntimeError as _:
         # If the loop isn't running, RuntimeError is raised.  Run normally
         loop = asyncio.get_event_loop()
-        loop.run_forever()
+        try:
+            loop.run_forever()
+        finally:
+            loop.run_until_complete(_podping_hivewriter.aclose())
     except KeyboardInterrupt:
         typer.Exit()
 
@@ -349,6 +383,8 @@ def callback(
         datefmt="%Y-%m-%dT%H:%M:%S%z",
     )
 
+    install_uvloop()
+
     if Config.livetest:
         Config.operation_id = LIVETEST_OPERATION_ID
     else:
@@ -10,3 +10,14 @@ PODPING_SETTINGS_KEY = "podping-settings"
 
 # Operation JSON must be less than or equal to 8192 bytes.
 HIVE_CUSTOM_OP_DATA_MAX_LENGTH = 8192
+
+# Seconds to wait for room in a full IRI queue before telling the client to retry
+IRI_QUEUE_FULL_TIMEOUT = 1
+
+# Number of ZeroMQ requests handled concurrently
+ZMQ_RESPONSE_WORKERS = 4
+
+# Tries for a JSON-RPC call that hits a transport error, and the first backoff
+# in seconds, doubled between tries.  Kept short, retries after that move nodes.
+RPC_REQUEST_TRIES = 3
+RPC_REQUEST_BACKOFF = 0.5
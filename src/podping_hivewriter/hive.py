@@ -1,11 +1,45 @@
 import asyncio
+import hashlib
+import itertools
+import json
 import logging
+import struct
+from binascii import hexlify, unhexlify
+from collections import OrderedDict
+from datetime import datetime, timedelta
 from timeit import default_timer as timer
-from typing import List, Optional, Set
+from typing import Any, List, Optional, Set
 
+import ecdsa
+import httpx
+from lighthive.broadcast.key_objects import PrivateKey
+from lighthive.broadcast.transaction_builder import TransactionBuilder
+from lighthive.broadcast.utils import compat_bytes
 from lighthive.client import Client
+from lighthive.datastructures import Operation
+from lighthive.exceptions import RPCNodeException
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from podping_hivewriter.async_wrapper import sync_to_async
+from podping_hivewriter.constants import RPC_REQUEST_BACKOFF, RPC_REQUEST_TRIES
+
+_rpc_request_ids = itertools.count(1)
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def json_dumps(obj: Any) -> bytes:
+    """Compact JSON as UTF-8 bytes, using orjson when it's installed.
+
+    Both paths write non-ASCII as raw UTF-8 so the bytes, and payload size
+    checks, don't depend on which is installed"""
+    if orjson:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("UTF-8")
 
 
 def get_client(
@@ -33,6 +67,161 @@ def get_client(
         raise ex
 
 
+async def rpc_request(
+    http_client: httpx.AsyncClient,
+    node: str,
+    method: str,
+    params: Any,
+    idempotent: bool = True,
+) -> Any:
+    """Make a single JSON-RPC call, raising RPCNodeException on an error response
+    the same way lighthive does.
+
+    Transport errors are retried on the same node with exponential backoff, as
+    lighthive did, up to RPC_REQUEST_TRIES times.  Calls that aren't idempotent
+    are only retried when the request never reached the node"""
+    request_body = json_dumps(
+        {
+            "jsonrpc": "2.0",
+            "method": method,
+            "params": params,
+            "id": next(_rpc_request_ids),
+        }
+    )
+    for attempt in range(1, RPC_REQUEST_TRIES + 1):
+        try:
+            response = await http_client.post(
+                node, content=request_body, headers=_JSON_HEADERS
+            )
+            break
+        except httpx.TransportError as ex:
+            not_sent = isinstance(
+                ex, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+            )
+            if attempt == RPC_REQUEST_TRIES or not (idempotent or not_sent):
+                raise
+            logging.debug(f"Retrying {method} on {node} after {ex!r}")
+            await asyncio.sleep(RPC_REQUEST_BACKOFF * 2 ** (attempt - 1))
+    response.raise_for_status()
+    body = response.json()
+    if "error" in body:
+        raise RPCNodeException(
+            body["error"].get("message"),
+            code=body["error"].get("code"),
+            raw_body=body,
+        )
+    return body["result"]
+
+
+def is_canonical(signature: bytes) -> bool:
+    """Hive only accepts signatures where neither r nor s needs a padding byte
+    in DER form, ie. both are exactly 32 bytes"""
+    return (
+        not (signature[0] & 0x80)
+        and not (signature[0] == 0 and not (signature[1] & 0x80))
+        and not (signature[32] & 0x80)
+        and not (signature[32] == 0 and not (signature[33] & 0x80))
+    )
+
+
+def sign_transaction(tx_hex: str, keys: List[str], chain="HIVE") -> List[str]:
+    """Sign a serialized transaction with each key, returning hex signatures.
+
+    Mirrors lighthive's ecdsa signing path, searching for a canonical signature
+    by varying the deterministic nonce"""
+    transaction_builder = TransactionBuilder(None)
+    transaction_builder.derive_digest(chain, tx_hex)
+    digest = transaction_builder.digest
+
+    signatures = []
+    for wif in keys:
+        signing_key = ecdsa.SigningKey.from_string(
+            compat_bytes(PrivateKey(wif)), curve=ecdsa.SECP256k1
+        )
+        verifying_key = signing_key.get_verifying_key()
+        for attempt in itertools.count():
+            signature = signing_key.sign_digest_deterministic(
+                digest,
+                hashfunc=hashlib.sha256,
+                sigencode=ecdsa.util.sigencode_string,
+                extra_entropy=struct.pack("<I", attempt),
+            )
+            if is_canonical(signature):
+                break
+
+        for i in range(4):
+            public_key = transaction_builder.recover_public_key(digest, signature, i)
+            if public_key and (
+                public_key.to_string() == verifying_key.to_string()
+                or transaction_builder.compressed_pubkey(public_key)
+                == verifying_key.to_string()
+            ):
+                break
+        else:
+            raise ValueError("Unable to recover public key from signature")
+
+        # Compact signature header: recovery id + 4 (compressed) + 27
+        signatures.append(
+            hexlify(struct.pack("<B", i + 4 + 27) + signature).decode("ascii")
+        )
+
+    return signatures
+
+
+async def broadcast_operations(
+    http_client: httpx.AsyncClient,
+    node: str,
+    operations: List[Operation],
+    keys: List[str],
+    chain="HIVE",
+    dry_run=False,
+) -> Any:
+    """Build, sign and broadcast a transaction without blocking the event loop.
+
+    Returns the signed transaction instead of broadcasting if dry_run is set"""
+    properties = await rpc_request(
+        http_client, node, "database_api.get_dynamic_global_properties", {}
+    )
+    head_block_number = properties["head_block_number"]
+    ref_block = (
+        await rpc_request(
+            http_client,
+            node,
+            "block_api.get_block",
+            {"block_num": head_block_number - 2},
+        )
+    )["block"]
+    expiration = datetime.fromisoformat(properties["time"]) + timedelta(seconds=30)
+
+    transaction = OrderedDict()
+    transaction["ref_block_num"] = head_block_number - 3 & 0xFFFF
+    transaction["ref_block_prefix"] = struct.unpack_from(
+        "<I", unhexlify(ref_block["previous"]), 4
+    )[0]
+    transaction["expiration"] = expiration.strftime("%Y-%m-%dT%H:%M:%S")
+    transaction["operations"] = [op.to_dict() for op in operations]
+    transaction["extensions"] = []
+    transaction["signatures"] = []
+
+    tx_hex = await rpc_request(
+        http_client, node, "condenser_api.get_transaction_hex", [transaction]
+    )
+    transaction["signatures"] = sign_transaction(tx_hex, keys, chain)
+
+    if dry_run:
+        return transaction
+
+    # A timed out broadcast may still have been accepted, retrying it could
+    # post the same operations twice
+    return await rpc_request(
+        http_client,
+        node,
+        "condenser_api.broadcast_transaction",
+        [transaction],
+        idempotent=False,
+    )
+
+
 def get_allowed_accounts(
     client: Client = None, account_name: str = "podping"
 ) -> Set[str]:
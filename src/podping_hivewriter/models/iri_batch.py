@@ -1,13 +1,13 @@
 import uuid
-from typing import Set
+from typing import List
 
 from pydantic import BaseModel, validator
 
 
 class IRIBatch(BaseModel):
-    batch_id: uuid.UUID
-    iri_set: Set[str]
+    batch_id: str
+    iri_list: List[str]
 
     @validator("batch_id", pre=True, always=True)
-    def default_batch_id(cls, v: uuid.UUID) -> uuid.UUID:
-        return v or uuid.uuid4()
+    def default_batch_id(cls, v: str) -> str:
+        return v or uuid.uuid4().hex
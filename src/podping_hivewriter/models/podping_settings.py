@@ -11,6 +11,8 @@ class PodpingSettings(BaseModel):
     diagnostic_report_period: int = 60
     control_account: str = "podping"
     control_account_check_period: int = 60
+    max_concurrent_broadcasts: int = 4
+    max_queue_depth: int = 10000
     test_nodes: Tuple[str, ...] = ("https://testnet.openhive.network",)
 
     @validator("hive_operation_period")
@@ -20,3 +22,17 @@ class PodpingSettings(BaseModel):
         if v < 1:
             v = 1
         return v
+
+    @validator("max_concurrent_broadcasts")
+    def max_concurrent_broadcasts_at_least_one(cls, v):
+        """Always allow at least one broadcast in flight"""
+        if v < 1:
+            v = 1
+        return v
+
+    @validator("max_queue_depth")
+    def max_queue_depth_at_least_one(cls, v):
+        """A queue size of 0 would make the queue unbounded"""
+        if v < 1:
+            v = 1
+        return v
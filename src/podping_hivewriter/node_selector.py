@@ -0,0 +1,64 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+class NodeStat:
+    """Health of a single Hive API node"""
+
+    def __init__(self):
+        # Consecutive failed broadcasts, only a successful broadcast clears them
+        self.failure_count: int = 0
+        # Whether the last health check failed
+        self.check_failed: bool = False
+        self.latency_ms: Optional[float] = None
+
+    @property
+    def score(self) -> Tuple[int, float]:
+        """Lower is better. Compared on failures first, so a node with fewer
+        consecutive failures wins however slow it is"""
+        return self.failure_count + self.check_failed, self.latency_ms or 0
+
+
+class NodeSelector:
+    """Ranks Hive API nodes by consecutive failures, then by a moving average
+    of their latency, so retries route around nodes that are down or slow"""
+
+    def __init__(self, nodes: Iterable[str], latency_weight: float = 0.3):
+        self.latency_weight = latency_weight
+        self._node_stats: Dict[str, NodeStat] = {node: NodeStat() for node in nodes}
+
+    @property
+    def current_node(self) -> str:
+        # There are only a handful of nodes.  min keeps the first of equal
+        # scores, so ties go to the original node order.
+        return min(self._node_stats, key=lambda node: self._node_stats[node].score)
+
+    @property
+    def nodes(self) -> List[str]:
+        return list(self._node_stats)
+
+    def stats(self, node: str) -> NodeStat:
+        return self._node_stats[node]
+
+    def record_success(self, node: str) -> None:
+        """Record a successful broadcast through node"""
+        self._node_stats[node].failure_count = 0
+
+    def record_failure(self, node: str) -> None:
+        """Record a failed broadcast through node"""
+        self._node_stats[node].failure_count += 1
+
+    def record_latency(self, node: str, latency: float) -> None:
+        """Record a passed health check.  latency, in seconds, should be for a
+        single RPC call so every sample is comparable.  Leaves broadcast
+        failures alone, a node that answers can still fail to broadcast"""
+        stat = self._node_stats[node]
+        latency_ms = latency * 1000
+        if stat.latency_ms is None:
+            stat.latency_ms = latency_ms
+        else:
+            stat.latency_ms += self.latency_weight * (latency_ms - stat.latency_ms)
+        stat.check_failed = False
+
+    def record_check_failure(self, node: str) -> None:
+        """Record a failed health check"""
+        self._node_stats[node].check_failed = True
@@ -1,40 +1,76 @@
 import asyncio
-import json
+import functools
+import itertools
 import logging
+import random
 import re
 import sys
 import uuid
 from datetime import datetime, timedelta
-from itertools import cycle
 from timeit import default_timer as timer
-from typing import List, Set, Tuple, Union, Optional
+from typing import Iterable, List, Set, Tuple, Union, Optional
 
+import httpx
 import rfc3987
 from lighthive.datastructures import Operation
 from lighthive.exceptions import RPCNodeException
-from lighthive.node_picker import compare_nodes
 
 from podping_hivewriter import __version__ as podping_hivewriter_version
 from podping_hivewriter.async_context import AsyncContext
-from podping_hivewriter.async_wrapper import sync_to_async
 from podping_hivewriter.constants import (
     HIVE_CUSTOM_OP_DATA_MAX_LENGTH,
+    IRI_QUEUE_FULL_TIMEOUT,
     STARTUP_FAILED_INVALID_POSTING_KEY_EXIT_CODE,
     STARTUP_FAILED_UNKNOWN_EXIT_CODE,
     STARTUP_OPERATION_ID,
+    ZMQ_RESPONSE_WORKERS,
 )
 from podping_hivewriter.exceptions import (
     PodpingCustomJsonPayloadExceeded,
     TooManyCustomJsonsPerBlock,
 )
-from podping_hivewriter.hive import get_allowed_accounts, get_client
+from podping_hivewriter.hive import (
+    broadcast_operations,
+    get_allowed_accounts,
+    get_client,
+    json_dumps,
+    rpc_request,
+)
 from podping_hivewriter.models.hive_operation_id import HiveOperationId
 from podping_hivewriter.models.iri_batch import IRIBatch
 from podping_hivewriter.models.medium import Medium
 from podping_hivewriter.models.podping import Podping
 from podping_hivewriter.models.reason import Reason
+from podping_hivewriter.node_selector import NodeSelector
 from podping_hivewriter.podping_settings_manager import PodpingSettingsManager
 
+# Same pattern rfc3987.match(iri, "IRI") uses from its compiled pattern cache,
+# held here to skip formatting the rule and the cache lookup on every call
+_IRI_RE = rfc3987.get_compiled_pattern("^%(IRI)s$")
+
+_PODPING_VERSION = Podping.__fields__["version"].default
+
+_PLUGIN_EXCEPTION_RE = re.compile(r"plugin exception.*custom json.*")
+
+# Seeded from os.urandom so writers restarted together don't retry in lockstep
+_retry_random = random.SystemRandom()
+
+
+def _is_account_error(ex: RPCNodeException) -> bool:
+    """Whether an RPC error is about the account rather than the node: too many
+    custom_jsons this block, or a posting key without authority"""
+    error = (ex.raw_body or {}).get("error", {})
+    return bool(_PLUGIN_EXCEPTION_RE.match(error.get("message", ""))) or (
+        error.get("data", {}).get("name") == "tx_missing_posting_auth"
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _hive_operation_id_str(operation_id: str, medium: Medium, reason: Reason) -> str:
+    """There are only a handful of operation id/medium/reason combinations,
+    so build each id string once"""
+    return str(HiveOperationId(operation_id, medium, reason))
+
 
 class PodpingHivewriter(AsyncContext):
     def __init__(
@@ -56,6 +92,13 @@ class PodpingHivewriter(AsyncContext):
 
         self.server_account: str = server_account
         self.required_posting_auths = [self.server_account]
+        # Only id and json change between operations, copied in construct_operation
+        self._custom_json_template = {
+            "required_auths": [],
+            "required_posting_auths": self.required_posting_auths,
+            "id": None,
+            "json": None,
+        }
         self.settings_manager = settings_manager
         self.medium = medium
         self.reason = reason
@@ -74,19 +117,29 @@ class PodpingHivewriter(AsyncContext):
             automatic_node_selection=False,  # TODO: File upstream lighthive bug because it runs asyncio in a new loop
         )
 
-        self._async_hive_broadcast = sync_to_async(
-            self.lighthive_client.broadcast, thread_sensitive=False
+        self.node_selector = NodeSelector(self.lighthive_client.nodes)
+
+        self._http_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(
+                self.lighthive_client.read_timeout,
+                connect=self.lighthive_client.connect_timeout,
+            )
         )
 
         self.total_iris_recv = 0
         self.total_iris_sent = 0
         self.total_iris_recv_deduped = 0
 
+        # Only touched from the event loop, so no lock is needed
         self._iris_in_flight = 0
-        self._iris_in_flight_lock = asyncio.Lock()
 
-        self.iri_batch_queue: "asyncio.Queue[IRIBatch]" = asyncio.Queue()
-        self.iri_queue: "asyncio.Queue[str]" = asyncio.Queue()
+        # Bounded by settings, so created in _startup
+        self.iri_batch_queue: Optional["asyncio.Queue[IRIBatch]"] = None
+        self.iri_queue: Optional["asyncio.Queue[str]"] = None
+
+        # Batch ids only correlate log lines, a counter is enough
+        self._session_id = uuid.uuid4().hex[:8]
+        self._batch_seq = itertools.count()
 
         self.startup_datetime = datetime.utcnow()
         self.startup_time = timer()
@@ -94,10 +147,22 @@ class PodpingHivewriter(AsyncContext):
         self._startup_done = False
         asyncio.ensure_future(self._startup())
 
+    async def aclose(self):
+        await super().aclose()
+        await self._http_client.aclose()
+
     async def _startup(self):
 
         try:
             settings = await self.settings_manager.get_settings()
+
+            # Bound both queues so a slow Hive node pushes back on ZeroMQ clients
+            # instead of growing memory.  One waiting batch per broadcast slot.
+            self.iri_batch_queue = asyncio.Queue(
+                maxsize=settings.max_concurrent_broadcasts
+            )
+            self.iri_queue = asyncio.Queue(maxsize=settings.max_queue_depth)
+
             allowed = get_allowed_accounts(
                 self.lighthive_client, settings.control_account
             )
@@ -128,14 +193,32 @@ class PodpingHivewriter(AsyncContext):
         self._startup_done = True
 
     async def automatic_node_selection(self) -> None:
-        """Use the automatic async feature to find the fastest API"""
-        self.lighthive_client._node_list = await compare_nodes(
-            nodes=self.lighthive_client.nodes, logger=self.lighthive_client.logger
-        )
-        self.lighthive_client.node_list = cycle(self.lighthive_client._node_list)
-        self.lighthive_client.next_node()
+        """Measure every API node and switch to the healthiest"""
+
+        async def measure_node(node: str):
+            start = timer()
+            try:
+                await rpc_request(
+                    self._http_client,
+                    node,
+                    "database_api.get_dynamic_global_properties",
+                    {},
+                )
+            except Exception as ex:
+                logging.debug(f"Node {node} failed health check: {ex}")
+                self.node_selector.record_check_failure(node)
+            else:
+                self.node_selector.record_latency(node, timer() - start)
+
+        await asyncio.gather(*(measure_node(node) for node in self.node_selector.nodes))
+        self._use_best_node()
         logging.info(f"Lighthive Fastest: {self.lighthive_client.current_node}")
 
+    def _use_best_node(self) -> None:
+        """Point lighthive, which still handles account and RC lookups,
+        at the current best node"""
+        self.lighthive_client.current_node = self.node_selector.current_node
+
     async def test_hive_resources(self):
         logging.info(
             "Podping startup sequence initiated, please stand by, "
@@ -206,6 +289,9 @@ class PodpingHivewriter(AsyncContext):
             sys.exit(STARTUP_FAILED_UNKNOWN_EXIT_CODE)
 
     async def wait_startup(self):
+        # Called before every send, skip the settings lookup once started
+        if self._startup_done:
+            return
         settings = await self.settings_manager.get_settings()
         while not self._startup_done:
             await asyncio.sleep(settings.hive_operation_period)
@@ -222,27 +308,20 @@ class PodpingHivewriter(AsyncContext):
                 raise
 
     async def _iri_batch_handler_loop(self):
-        """Opens and watches a queue and sends notifications to Hive one by one"""
+        """Opens and watches a queue and sends notifications to Hive,
+        up to max_concurrent_broadcasts batches at a time"""
+        settings = await self.settings_manager.get_settings()
+        broadcast_semaphore = asyncio.Semaphore(settings.max_concurrent_broadcasts)
+
         while True:
             try:
                 iri_batch = await self.iri_batch_queue.get()
 
-                start = timer()
-                failure_count = await self.failure_retry(
-                    iri_batch.iri_set, medium=self.medium, reason=self.reason
-                )
-                duration = timer() - start
-
-                self.iri_batch_queue.task_done()
-                async with self._iris_in_flight_lock:
-                    self._iris_in_flight -= len(iri_batch.iri_set)
-
-                last_node = self.lighthive_client.current_node
-                logging.info(
-                    f"Batch send time: {duration:0.2f} | "
-                    f"Failures: {failure_count} - IRI batch_id {iri_batch.batch_id} | "
-                    f"IRIs in batch: {len(iri_batch.iri_set)} | "
-                    f"last_node: {last_node}"
+                await broadcast_semaphore.acquire()
+                self._add_task(
+                    asyncio.create_task(
+                        self._iri_batch_handler(iri_batch, broadcast_semaphore)
+                    )
                 )
             except asyncio.CancelledError:
                 raise
@@ -250,22 +329,53 @@ class PodpingHivewriter(AsyncContext):
                 logging.error(f"{ex} occurred", exc_info=True)
                 raise
 
-    async def _iri_batch_loop(self):
-        async def get_from_queue():
-            try:
-                return await self.iri_queue.get()
-            except RuntimeError:
-                return
+    async def _iri_batch_handler(
+        self, iri_batch: IRIBatch, broadcast_semaphore: asyncio.Semaphore
+    ):
+        try:
+            start = timer()
+            failure_count = await self.failure_retry(
+                iri_batch.iri_list, medium=self.medium, reason=self.reason
+            )
+            duration = timer() - start
 
+            last_node = self.lighthive_client.current_node
+            logging.info(
+                f"Batch send time: {duration:0.2f} | "
+                f"Failures: {failure_count} - IRI batch_id {iri_batch.batch_id} | "
+                f"IRIs in batch: {len(iri_batch.iri_list)} | "
+                f"last_node: {last_node}"
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception as ex:
+            logging.error(f"{ex} occurred", exc_info=True)
+        finally:
+            self.iri_batch_queue.task_done()
+            self._iris_in_flight -= len(iri_batch.iri_list)
+            broadcast_semaphore.release()
+
+    async def _iri_batch_loop(self):
         settings = await self.settings_manager.get_settings()
+        # Settings can't change more often than the manager checks for them
+        settings_refresh_at = timer() + settings.control_account_check_period
 
         while True:
-            iri_set: Set[str] = set()
+            if timer() > settings_refresh_at:
+                settings = await self.settings_manager.get_settings()
+                settings_refresh_at = timer() + settings.control_account_check_period
+
+            # List keeps the IRIs in the order received, the set is just for dedup
+            iri_list: List[str] = []
+            seen_iris: Set[str] = set()
             start = timer()
             duration = 0
-            iris_size_without_commas = 0
-            iris_size_total = 0
-            batch_id = uuid.uuid4()
+            # Size of payload in bytes is
+            # length of IRIs in bytes + 2 quotes and a comma each + 2 square brackets
+            # minus the trailing comma
+            # Assuming it's a JSON list eg ["https://...","https://"..."]
+            iris_size_total = 1
+            batch_id = f"{self._session_id}-{next(self._batch_seq)}"
 
             # Wait until we have enough IRIs to fit in the payload
             # or get into the current Hive block
@@ -274,27 +384,33 @@ class PodpingHivewriter(AsyncContext):
                 and iris_size_total < settings.max_url_list_bytes
             ):
                 try:
-                    iri = await asyncio.wait_for(
-                        get_from_queue(),
-                        timeout=settings.hive_operation_period,
-                    )
-                    iri_set.add(iri)
+                    # Drain whatever is already queued without a scheduler round
+                    # trip, only wait (for the rest of the period) when it's empty
+                    try:
+                        iri = self.iri_queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        iri = await asyncio.wait_for(
+                            self.iri_queue.get(),
+                            timeout=settings.hive_operation_period - duration,
+                        )
                     self.iri_queue.task_done()
+                    if not iri or iri in seen_iris:
+                        # Never reaches a batch, so it's no longer in flight
+                        self._iris_in_flight -= 1
+                        continue
+                    seen_iris.add(iri)
+                    iri_list.append(iri)
 
                     logging.debug(
                         f"_iri_batch_loop - Duration: {duration:.3f} - "
                         f"IRI in queue: {iri} - "
                         f"IRI batch_id {batch_id} - "
-                        f"Num IRIs: {len(iri_set)}"
+                        f"Num IRIs: {len(iri_list)}"
                     )
 
-                    # byte size of IRI in JSON is IRI + 2 quotes
-                    iris_size_without_commas += len(iri.encode("UTF-8")) + 2
-
-                    # Size of payload in bytes is
-                    # length of IRIs in bytes + the number of commas + 2 square brackets
-                    # Assuming it's a JSON list eg ["https://...","https://"..."]
-                    iris_size_total = iris_size_without_commas + len(iri_set) - 1 + 2
+                    # ASCII IRIs are one byte per character, skip the encode
+                    iri_len = len(iri) if iri.isascii() else len(iri.encode("UTF-8"))
+                    iris_size_total += iri_len + 3
                 except asyncio.TimeoutError:
                     pass
                 except asyncio.CancelledError:
@@ -306,10 +422,10 @@ class PodpingHivewriter(AsyncContext):
                     duration = timer() - start
 
             try:
-                if len(iri_set):
-                    iri_batch = IRIBatch(batch_id=batch_id, iri_set=iri_set)
+                if len(iri_list):
+                    iri_batch = IRIBatch(batch_id=batch_id, iri_list=iri_list)
                     await self.iri_batch_queue.put(iri_batch)
-                    self.total_iris_recv_deduped += len(iri_set)
+                    self.total_iris_recv_deduped += len(iri_list)
                     logging.info(
                         f"IRI batch_id {batch_id} - Size of IRIs: {iris_size_total}"
                     )
@@ -322,32 +438,97 @@ class PodpingHivewriter(AsyncContext):
         import zmq.asyncio
 
         context = zmq.asyncio.Context()
-        socket = context.socket(zmq.REP)
+        # ROUTER rather than REP so one slow request doesn't hold up the rest.
+        # Works with existing REQ clients, replies are routed by envelope.
+        socket = context.socket(zmq.ROUTER)
         # TODO: Check IPv6 support
         socket.bind(f"tcp://{self.listen_ip}:{self.listen_port}")
 
         logging.info(f"Running ZeroMQ server on {self.listen_ip}:{self.listen_port}")
 
+        # Kept small so recv stops, and ZeroMQ pushes back, when workers are stuck
+        requests: "asyncio.Queue[List[bytes]]" = asyncio.Queue(
+            maxsize=ZMQ_RESPONSE_WORKERS
+        )
+        workers = [
+            asyncio.create_task(self._zmq_response_worker(socket, requests))
+            for _ in range(ZMQ_RESPONSE_WORKERS)
+        ]
+
+        try:
+            while True:
+                try:
+                    await requests.put(await socket.recv_multipart())
+                except asyncio.CancelledError:
+                    raise
+                except Exception as ex:
+                    logging.error(f"{ex} occurred", exc_info=True)
+        finally:
+            for worker in workers:
+                worker.cancel()
+            socket.close()
+
+    async def _zmq_response_worker(
+        self, socket, requests: "asyncio.Queue[List[bytes]]"
+    ):
         while True:
+            frames = await requests.get()
+            # Everything before the last frame is the routing envelope
+            envelope, message = frames[:-1], frames[-1]
             try:
-                iri: str = await socket.recv_string()
-                if rfc3987.match(iri, "IRI"):
-                    await self.iri_queue.put(iri)
-                    async with self._iris_in_flight_lock:
-                        self._iris_in_flight += 1
-                    self.total_iris_recv += 1
-                    await socket.send_string("OK")
-                else:
-                    await socket.send_string("Invalid IRI")
+                response = await self._receive_iri(message.decode("UTF-8"))
+            except UnicodeDecodeError:
+                response = "Invalid IRI"
             except asyncio.CancelledError:
-                socket.close()
                 raise
             except Exception as ex:
                 logging.error(f"{ex} occurred", exc_info=True)
+                response = "Error"
 
-    async def num_operations_in_queue(self) -> int:
-        async with self._iris_in_flight_lock:
-            return self._iris_in_flight
+            try:
+                await socket.send_multipart(envelope + [response.encode("UTF-8")])
+            except asyncio.CancelledError:
+                raise
+            except Exception as ex:
+                logging.error(f"{ex} occurred", exc_info=True)
+
+    async def _receive_iri(self, iri: str) -> str:
+        """Validate and queue an IRI from a ZeroMQ client, returning the reply"""
+        if not _IRI_RE.match(iri):
+            return "Invalid IRI"
+
+        # Counted before it's queued, the batch loop can take it off the queue
+        # (and subtract it again) while we wait for room
+        self._iris_in_flight += 1
+        if not await self._queue_iri(iri):
+            self._iris_in_flight -= 1
+            return "Busy"
+
+        self.total_iris_recv += 1
+        return "OK"
+
+    async def _queue_iri(self, iri: str) -> bool:
+        """Queue an IRI, waiting up to IRI_QUEUE_FULL_TIMEOUT for room.
+        Returns whether it was queued"""
+        try:
+            self.iri_queue.put_nowait(iri)
+            return True
+        except asyncio.QueueFull:
+            pass
+
+        # Not wait_for, it can time out after the put has already gone through.
+        # A put that was let in before the cancel still completes.
+        put = asyncio.ensure_future(self.iri_queue.put(iri))
+        try:
+            await asyncio.wait((put,), timeout=IRI_QUEUE_FULL_TIMEOUT)
+        finally:
+            put.cancel()
+            await asyncio.wait((put,))
+        return not put.cancelled()
+
+    @property
+    def num_operations_in_queue(self) -> int:
+        return self._iris_in_flight
 
     async def output_hive_status(self) -> None:
         """Output the name of the current hive node
@@ -363,24 +544,54 @@ class PodpingHivewriter(AsyncContext):
             f"last_node: {last_node}"
         )
 
+    async def _async_hive_broadcast(
+        self, op: Union[Operation, List[Operation]], dry_run: bool = False
+    ):
+        """Broadcast natively on the event loop rather than through lighthive's
+        blocking client on a worker thread"""
+        node = self.node_selector.current_node
+        try:
+            result = await broadcast_operations(
+                self._http_client,
+                node,
+                op if isinstance(op, list) else [op],
+                self.posting_keys,
+                chain=self.lighthive_client.chain,
+                dry_run=dry_run,
+            )
+        except RPCNodeException as ex:
+            # Any node would give the same answer about the account, retrying
+            # elsewhere won't help
+            if not _is_account_error(ex):
+                self.node_selector.record_failure(node)
+            raise
+        except Exception:
+            # Anything else, down to a body without a result, means moving on
+            self.node_selector.record_failure(node)
+            raise
+        else:
+            # A broadcast is several RPC calls, so its timing isn't comparable
+            # with the single call health checks.  Only clear the node's failures.
+            self.node_selector.record_success(node)
+            return result
+        finally:
+            self._use_best_node()
+
     async def construct_operation(
         self, payload: dict, hive_operation_id: Union[HiveOperationId, str]
     ) -> Tuple[Operation, int]:
         """Builed the operation for the blockchain"""
-        payload_json = json.dumps(payload, separators=(",", ":"))
-        size_of_json = len(payload_json)
+        # Size limit is in bytes, measure before decoding
+        payload_bytes = json_dumps(payload)
+        size_of_json = len(payload_bytes)
+        payload_json = payload_bytes.decode("UTF-8")
         if size_of_json > HIVE_CUSTOM_OP_DATA_MAX_LENGTH:
             raise PodpingCustomJsonPayloadExceeded("Max custom_json payload exceeded")
 
-        op = Operation(
-            "custom_json",
-            {
-                "required_auths": [],
-                "required_posting_auths": self.required_posting_auths,
-                "id": str(hive_operation_id),
-                "json": payload_json,
-            },
-        )
+        op_value = self._custom_json_template.copy()
+        op_value["id"] = str(hive_operation_id)
+        op_value["json"] = payload_json
+        op = Operation("custom_json", op_value)
         return op, size_of_json
 
     async def send_notification(
@@ -404,10 +615,8 @@ class PodpingHivewriter(AsyncContext):
 
         except RPCNodeException as ex:
             logging.error(f"send_notification error: {ex}")
-            if re.match(
-                r"plugin exception.*custom json.*", ex.raw_body["error"]["message"]
-            ):
-                self.lighthive_client.next_node()
+            error_message = ex.raw_body["error"]["message"]
+            if _PLUGIN_EXCEPTION_RE.match(error_message):
                 raise TooManyCustomJsonsPerBlock()
             raise ex
 
@@ -424,11 +633,11 @@ class PodpingHivewriter(AsyncContext):
         medium: Optional[Medium],
         reason: Optional[Reason],
     ) -> None:
-        payload = Podping(
-            medium=medium or self.medium, reason=reason or self.reason, iris=[iri]
-        )
+        medium = medium or self.medium
+        reason = reason or self.reason
+        payload = Podping(medium=medium, reason=reason, iris=[iri])
 
-        hive_operation_id = HiveOperationId(self.operation_id, medium, reason)
+        hive_operation_id = _hive_operation_id_str(self.operation_id, medium, reason)
 
         await self.send_notification(payload.dict(), hive_operation_id)
 
@@ -436,58 +645,71 @@ class PodpingHivewriter(AsyncContext):
 
     async def send_notification_iris(
         self,
-        iris: Set[str],
+        iris: List[str],
         medium: Optional[Medium],
         reason: Optional[Reason],
     ) -> None:
         num_iris = len(iris)
-        payload = Podping(
-            medium=medium or self.medium, reason=reason or self.reason, iris=list(iris)
-        )
+        medium = medium or self.medium
+        reason = reason or self.reason
+        # Same shape as Podping(...).dict(), built directly to skip validating
+        # the IRIs again on every batch.  They were validated on the way in.
+        payload = {
+            "version": _PODPING_VERSION,
+            "medium": str(medium),
+            "reason": str(reason),
+            "iris": iris,
+        }
 
-        hive_operation_id = HiveOperationId(self.operation_id, medium, reason)
+        hive_operation_id = _hive_operation_id_str(self.operation_id, medium, reason)
 
-        await self.send_notification(payload.dict(), hive_operation_id)
+        await self.send_notification(payload, hive_operation_id)
 
         self.total_iris_sent += num_iris
 
     async def failure_retry(
         self,
-        iri_set: Set[str],
+        iri_set: Iterable[str],
         medium: Optional[Medium],
         reason: Optional[Reason],
     ) -> int:
+        # Any iterable works, IRIs are sent in the order it gives them
+        iri_list = list(iri_set)
         await self.wait_startup()
         failure_count = 0
+        sleep_time = 0.0
 
         while True:
-            # Sleep a maximum of 5 minutes, 3 additional seconds for every retry
-            sleep_time = min(failure_count * 3, 300)
             if failure_count > 0:
-                logging.warning(f"Waiting {sleep_time}s before retry")
+                # Sleep a random time up to a limit that doubles every retry,
+                # capped at 5 minutes, so writers hitting the same outage spread
+                # out.  The exponent is clamped well past where the cap kicks in.
+                backoff = min(3 * 2 ** min(failure_count, 10), 300)
+                sleep_time = _retry_random.uniform(1, backoff)
+                logging.warning(f"Waiting {sleep_time:.1f}s before retry")
                 await asyncio.sleep(sleep_time)
                 logging.info(
-                    f"FAILURE COUNT: {failure_count} - RETRYING {len(iri_set)} IRIs"
+                    f"FAILURE COUNT: {failure_count} - RETRYING {len(iri_list)} IRIs"
                 )
             else:
-                logging.info(f"Received {len(iri_set)} IRIs")
+                logging.info(f"Received {len(iri_list)} IRIs")
 
             try:
                 await self.send_notification_iris(
-                    iris=iri_set,
+                    iris=iri_list,
                     medium=medium or self.medium,
                     reason=reason or self.reason,
                 )
                 if failure_count > 0:
                     logging.info(
-                        f"FAILURE CLEARED after {failure_count} retries, {sleep_time}s"
+                        f"FAILURE CLEARED after {failure_count} retries, {sleep_time:.1f}s"
                     )
                 return failure_count
             except RPCNodeException as ex:
                 logging.warning(f"{ex}")
-                logging.warning(f"Failed to send {len(iri_set)} IRIs")
+                logging.warning(f"Failed to send {len(iri_list)} IRIs")
                 if ex.raw_body["error"]["data"]["name"] == "tx_missing_posting_auth":
-                    for iri in iri_set:
+                    for iri in iri_list:
                         logging.error(iri)
                     logging.error(
                         f"Terminating: exit code: "
@@ -496,12 +718,11 @@ class PodpingHivewriter(AsyncContext):
                     sys.exit(STARTUP_FAILED_INVALID_POSTING_KEY_EXIT_CODE)
 
             except Exception as ex:
-                logging.warning(f"Failed to send {len(iri_set)} IRIs")
+                logging.warning(f"Failed to send {len(iri_list)} IRIs")
                 logging.warning(f"{ex}")
                 if logging.DEBUG >= logging.root.level:
-                    for iri in iri_set:
+                    for iri in iri_list:
                         logging.debug(iri)
 
             finally:
-                self.lighthive_client.next_node()
                 failure_count += 1
@@ -83,10 +83,10 @@ async def test_write_zmq_multiple(event_loop):
         assert response == "OK"
 
     # Sleep until all items in the queue are done processing
-    num_iris_processing = await podping_hivewriter.num_operations_in_queue()
+    num_iris_processing = podping_hivewriter.num_operations_in_queue
     while num_iris_processing > 0:
         await asyncio.sleep(op_period)
-        num_iris_processing = await podping_hivewriter.num_operations_in_queue()
+        num_iris_processing = podping_hivewriter.num_operations_in_queue
 
     answer_iris = set()
     async for stream_iri in get_iri_from_blockchain(current_block):
@@ -0,0 +1,46 @@
+import asyncio
+
+import pytest_asyncio
+
+from podping_hivewriter import podping_hivewriter as podping_hivewriter_module
+from podping_hivewriter.models.podping_settings import PodpingSettings
+from podping_hivewriter.podping_hivewriter import PodpingHivewriter
+from podping_hivewriter.podping_settings_manager import PodpingSettingsManager
+
+TEST_ACCOUNT = "podping-unit-test"
+
+
+@pytest_asyncio.fixture
+async def make_podping_hivewriter(monkeypatch):
+    """Build writers that never talk to Hive: no resource test, no daemon
+    loops, and the allowed account lookup answered locally"""
+    monkeypatch.setattr(
+        podping_hivewriter_module,
+        "get_allowed_accounts",
+        lambda client, account_name: {TEST_ACCOUNT},
+    )
+    writers = []
+
+    async def make(**settings) -> PodpingHivewriter:
+        settings_manager = PodpingSettingsManager(ignore_updates=True)
+        # wait_startup polls once per hive_operation_period
+        settings.setdefault("hive_operation_period", 1)
+        settings_manager._settings = PodpingSettings(**settings)
+        writer = PodpingHivewriter(
+            TEST_ACCOUNT,
+            [],
+            settings_manager,
+            resource_test=False,
+            daemon=False,
+            status=False,
+        )
+        writers.append(writer)
+        await writer.wait_startup()
+        return writer
+
+    yield make
+
+    for writer in writers:
+        tasks = list(writer._tasks)
+        await writer.aclose()
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,104 @@
+import pytest
+from lighthive.exceptions import RPCNodeException
+
+from podping_hivewriter import podping_hivewriter as podping_hivewriter_module
+
+
+class _NoBackoff:
+    @staticmethod
+    def uniform(a, b):
+        return 0
+
+
+def fake_broadcasts(monkeypatch, errors: list):
+    """Fail broadcasts with each error in turn, then succeed.
+    Returns the node used for each broadcast"""
+    nodes = []
+
+    async def broadcast_operations(http_client, node, operations, keys, **kwargs):
+        nodes.append(node)
+        if len(nodes) <= len(errors):
+            raise errors[len(nodes) - 1]
+        return {}
+
+    monkeypatch.setattr(
+        podping_hivewriter_module, "broadcast_operations", broadcast_operations
+    )
+    monkeypatch.setattr(podping_hivewriter_module, "_retry_random", _NoBackoff)
+    return nodes
+
+
+def rpc_error(message, name):
+    return RPCNodeException(
+        message,
+        code=-32000,
+        raw_body={
+            "error": {"code": -32000, "message": message, "data": {"name": name}}
+        },
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.timeout(30)
+@pytest.mark.parametrize(
+    "error",
+    [
+        KeyError("result"),
+        ValueError("Expecting value: line 1 column 1 (char 0)"),
+        rpc_error("Unable to acquire database lock", "timeout_exception"),
+    ],
+)
+async def test_retry_after_node_failure_moves_node(
+    make_podping_hivewriter, monkeypatch, error
+):
+    podping_hivewriter = await make_podping_hivewriter()
+    nodes = fake_broadcasts(monkeypatch, [error])
+
+    failure_count = await podping_hivewriter.failure_retry(
+        ["https://example.com/feed.xml"], medium=None, reason=None
+    )
+
+    assert failure_count == 1
+    assert len(nodes) == 2
+    assert nodes[1] != nodes[0]
+    assert podping_hivewriter.lighthive_client.current_node == nodes[1]
+
+
+@pytest.mark.asyncio
+@pytest.mark.timeout(30)
+async def test_account_error_does_not_move_node(make_podping_hivewriter, monkeypatch):
+    podping_hivewriter = await make_podping_hivewriter()
+    nodes = fake_broadcasts(
+        monkeypatch,
+        [
+            rpc_error(
+                "plugin exception:Account: podping-unit-test already "
+                "submitted 5 custom json operation(s) this block.",
+                "plugin_exception",
+            )
+        ],
+    )
+
+    failure_count = await podping_hivewriter.failure_retry(
+        ["https://example.com/feed.xml"], medium=None, reason=None
+    )
+
+    assert failure_count == 1
+    assert nodes[1] == nodes[0]
+    assert podping_hivewriter.node_selector.stats(nodes[0]).failure_count == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.timeout(30)
+async def test_failure_retry_takes_iri_set_keyword(
+    make_podping_hivewriter, monkeypatch
+):
+    podping_hivewriter = await make_podping_hivewriter()
+    fake_broadcasts(monkeypatch, [])
+
+    failure_count = await podping_hivewriter.failure_retry(
+        iri_set={"https://example.com/feed.xml"}, medium=None, reason=None
+    )
+
+    assert failure_count == 0
+    assert podping_hivewriter.total_iris_sent == 1
@@ -0,0 +1,182 @@
+import json
+import os
+import struct
+from binascii import unhexlify
+
+import ecdsa
+import httpx
+import pytest
+from lighthive.broadcast.base58 import base58CheckEncode
+from lighthive.broadcast.transaction_builder import TransactionBuilder
+from lighthive.datastructures import Operation
+from lighthive.exceptions import RPCNodeException
+
+from podping_hivewriter.constants import RPC_REQUEST_TRIES
+from podping_hivewriter.hive import (
+    broadcast_operations,
+    is_canonical,
+    rpc_request,
+    sign_transaction,
+)
+
+
+def random_wif():
+    secret = os.urandom(32)
+    return secret, base58CheckEncode(0x80, secret.hex())
+
+
+def mock_node(results: dict):
+    """httpx client answering JSON-RPC calls from a method -> result/error map"""
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        calls.append(body)
+        result = results[body["method"]]
+        if isinstance(result, dict) and "error" in result:
+            return httpx.Response(200, json={"id": body["id"], **result})
+        return httpx.Response(200, json={"id": body["id"], "result": result})
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler)), calls
+
+
+@pytest.mark.parametrize("_", range(10))
+def test_sign_transaction_recovers_signing_key(_):
+    secret, wif = random_wif()
+    tx_hex = os.urandom(64).hex() + "00"
+
+    signatures = sign_transaction(tx_hex, [wif])
+
+    assert len(signatures) == 1
+    signature = unhexlify(signatures[0])
+    assert len(signature) == 65
+    recovery_id = struct.unpack("<B", signature[:1])[0] - 4 - 27
+    assert 0 <= recovery_id < 4
+    assert is_canonical(signature[1:])
+
+    transaction_builder = TransactionBuilder(None)
+    transaction_builder.derive_digest("HIVE", tx_hex)
+    public_key = transaction_builder.recover_public_key(
+        transaction_builder.digest, signature[1:], recovery_id
+    )
+    signing_key = ecdsa.SigningKey.from_string(secret, curve=ecdsa.SECP256k1)
+    assert public_key.to_string() == signing_key.get_verifying_key().to_string()
+
+
+@pytest.mark.asyncio
+async def test_rpc_request_error_raises_rpc_node_exception():
+    error = {
+        "code": -32000,
+        "message": "missing required posting authority",
+        "data": {"name": "tx_missing_posting_auth"},
+    }
+    http_client, calls = mock_node(
+        {"condenser_api.broadcast_transaction": {"error": error}}
+    )
+
+    async with http_client:
+        with pytest.raises(RPCNodeException) as exc_info:
+            await rpc_request(
+                http_client, "https://node", "condenser_api.broadcast_transaction", []
+            )
+
+    assert calls[0]["method"] == "condenser_api.broadcast_transaction"
+    assert exc_info.value.code == -32000
+    assert exc_info.value.raw_body["error"]["message"] == error["message"]
+    assert exc_info.value.raw_body["error"]["data"]["name"] == "tx_missing_posting_auth"
+
+
+@pytest.mark.asyncio
+async def test_broadcast_operations_dry_run_signs_without_broadcasting():
+    _, wif = random_wif()
+    http_client, calls = mock_node(
+        {
+            "database_api.get_dynamic_global_properties": {
+                "head_block_number": 1000,
+                "time": "2022-03-01T00:00:00",
+            },
+            "block_api.get_block": {"block": {"previous": "00" * 4 + "01020304"}},
+            "condenser_api.get_transaction_hex": os.urandom(64).hex() + "00",
+        }
+    )
+    op = Operation("custom_json", {"id": "pp", "json": "{}"})
+
+    async with http_client:
+        transaction = await broadcast_operations(
+            http_client, "https://node", [op], [wif], dry_run=True
+        )
+
+    assert [call["method"] for call in calls] == [
+        "database_api.get_dynamic_global_properties",
+        "block_api.get_block",
+        "condenser_api.get_transaction_hex",
+    ]
+    assert calls[1]["params"] == {"block_num": 998}
+    assert transaction["ref_block_num"] == 997
+    assert (
+        transaction["ref_block_prefix"] == struct.unpack("<I", b"\x01\x02\x03\x04")[0]
+    )
+    assert transaction["expiration"] == "2022-03-01T00:00:30"
+    assert transaction["operations"] == [op.to_dict()]
+    assert len(transaction["signatures"]) == 1
+
+
+def flaky_node(errors: list):
+    """httpx client raising each error in turn before answering"""
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if len(calls) <= len(errors):
+            raise errors[len(calls) - 1]("node unavailable", request=request)
+        body = json.loads(request.content)
+        return httpx.Response(200, json={"id": body["id"], "result": "ok"})
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler)), calls
+
+
+@pytest.mark.asyncio
+async def test_rpc_request_retries_transport_errors(monkeypatch):
+    monkeypatch.setattr("podping_hivewriter.hive.RPC_REQUEST_BACKOFF", 0)
+    http_client, calls = flaky_node([httpx.ReadTimeout, httpx.ConnectError])
+
+    async with http_client:
+        result = await rpc_request(
+            http_client, "https://node", "block_api.get_block", {"block_num": 1}
+        )
+
+    assert result == "ok"
+    assert len(calls) == RPC_REQUEST_TRIES
+
+
+@pytest.mark.asyncio
+async def test_rpc_request_gives_up_after_bounded_tries(monkeypatch):
+    monkeypatch.setattr("podping_hivewriter.hive.RPC_REQUEST_BACKOFF", 0)
+    http_client, calls = flaky_node([httpx.ConnectTimeout] * RPC_REQUEST_TRIES)
+
+    async with http_client:
+        with pytest.raises(httpx.ConnectTimeout):
+            await rpc_request(
+                http_client, "https://node", "block_api.get_block", {"block_num": 1}
+            )
+
+    assert len(calls) == RPC_REQUEST_TRIES
+
+
+@pytest.mark.asyncio
+async def test_rpc_request_only_retries_unsent_non_idempotent_calls(monkeypatch):
+    monkeypatch.setattr("podping_hivewriter.hive.RPC_REQUEST_BACKOFF", 0)
+    http_client, calls = flaky_node([httpx.ConnectError, httpx.ReadTimeout])
+
+    async with http_client:
+        with pytest.raises(httpx.ReadTimeout):
+            await rpc_request(
+                http_client,
+                "https://node",
+                "condenser_api.broadcast_transaction",
+                [],
+                idempotent=False,
+            )
+
+    # The connect error is retried, the read timeout might have been broadcast
+    assert len(calls) == 2
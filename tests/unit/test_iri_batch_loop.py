@@ -0,0 +1,115 @@
+import asyncio
+import logging
+import re
+
+import pytest
+
+from podping_hivewriter.hive import json_dumps
+
+_SIZE_LOG_RE = re.compile(r"IRI batch_id (\S+) - Size of IRIs: (\d+)")
+
+
+async def start_batch_loop(podping_hivewriter, monkeypatch):
+    """Run the batch loop, with broadcasts that succeed without sending"""
+    sent = []
+
+    async def failure_retry(iri_set, medium, reason):
+        sent.append(iri_set)
+        return 0
+
+    monkeypatch.setattr(podping_hivewriter, "failure_retry", failure_retry)
+    podping_hivewriter._add_task(
+        asyncio.create_task(podping_hivewriter._iri_batch_loop())
+    )
+    return sent
+
+
+async def next_batch(podping_hivewriter):
+    return await asyncio.wait_for(podping_hivewriter.iri_batch_queue.get(), 5)
+
+
+async def finish_batch(podping_hivewriter, iri_batch):
+    await podping_hivewriter._iri_batch_handler(iri_batch, asyncio.Semaphore())
+
+
+def batch_sizes(caplog):
+    return {
+        match.group(1): int(match.group(2))
+        for match in map(_SIZE_LOG_RE.match, caplog.messages)
+        if match
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.timeout(30)
+async def test_batch_keeps_order_and_drops_duplicates(
+    make_podping_hivewriter, monkeypatch, caplog
+):
+    caplog.set_level(logging.INFO)
+    podping_hivewriter = await make_podping_hivewriter(hive_operation_period=1)
+    iris = [
+        "https://example.com/a.xml",
+        "https://例え.jp/フィード.xml",
+        "https://example.com/a.xml",
+        "https://example.com/b.xml",
+        "https://例え.jp/フィード.xml",
+    ]
+    for iri in iris:
+        assert await podping_hivewriter._receive_iri(iri) == "OK"
+    assert podping_hivewriter.num_operations_in_queue == len(iris)
+
+    sent = await start_batch_loop(podping_hivewriter, monkeypatch)
+    iri_batch = await next_batch(podping_hivewriter)
+
+    expected = [
+        "https://example.com/a.xml",
+        "https://例え.jp/フィード.xml",
+        "https://example.com/b.xml",
+    ]
+    assert iri_batch.iri_list == expected
+    # Duplicates stop being in flight as soon as they're dropped
+    assert podping_hivewriter.num_operations_in_queue == len(expected)
+    # Non-ASCII IRIs are sized in UTF-8 bytes, same as the payload
+    assert batch_sizes(caplog)[iri_batch.batch_id] == len(json_dumps(expected))
+
+    await finish_batch(podping_hivewriter, iri_batch)
+
+    assert sent == [expected]
+    assert podping_hivewriter.num_operations_in_queue == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.timeout(30)
+async def test_batch_splits_at_max_url_list_bytes(
+    make_podping_hivewriter, monkeypatch, caplog
+):
+    caplog.set_level(logging.INFO)
+    # Each IRI is 30 characters, 33 bytes in the JSON list with quotes and comma
+    max_url_list_bytes = 100
+    podping_hivewriter = await make_podping_hivewriter(
+        hive_operation_period=1, max_url_list_bytes=max_url_list_bytes
+    )
+    iris = [f"https://example.com/feed/{i:05}" for i in range(7)]
+    for iri in iris:
+        assert await podping_hivewriter._receive_iri(iri) == "OK"
+
+    await start_batch_loop(podping_hivewriter, monkeypatch)
+    iri_batches = [await next_batch(podping_hivewriter) for _ in range(3)]
+
+    assert [iri_batch.iri_list for iri_batch in iri_batches] == [
+        iris[0:3],
+        iris[3:6],
+        iris[6:],
+    ]
+    sizes = batch_sizes(caplog)
+    for iri_batch in iri_batches:
+        size = sizes[iri_batch.batch_id]
+        assert size == len(json_dumps(iri_batch.iri_list))
+        # Full batches close on the IRI that reaches the limit
+        if len(iri_batch.iri_list) == 3:
+            assert size - len(iri_batch.iri_list[-1]) - 3 < max_url_list_bytes
+            assert size >= max_url_list_bytes
+
+    for iri_batch in iri_batches:
+        await finish_batch(podping_hivewriter, iri_batch)
+    assert podping_hivewriter.num_operations_in_queue == 0
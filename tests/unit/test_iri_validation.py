@@ -0,0 +1,28 @@
+import pytest
+import rfc3987
+
+from podping_hivewriter.podping_hivewriter import _IRI_RE
+
+
+@pytest.mark.parametrize(
+    "iri,valid",
+    [
+        ("https://example.com/feed.xml", True),
+        ("https://example.com/feed?t=1&v=3.10#top", True),
+        ("https://例え.jp/フィード.xml", True),
+        ("http://[::1]:8080/rss", True),
+        ("ipns://k51qzi5uqu5dl", True),
+        # $ also matches before a trailing newline, same as rfc3987.match
+        ("https://example.com/feed.xml\n", True),
+        ("", False),
+        ("example.com/feed.xml", False),
+        ("1http://example.com", False),
+        ("https://example.com/a feed.xml", False),
+        ("https://example.com/<feed>", False),
+        ("https://example.com/%zz", False),
+        ("http://[::1/rss", False),
+    ],
+)
+def test_iri_re_matches_rfc3987(iri, valid):
+    assert bool(_IRI_RE.match(iri)) is valid
+    assert bool(rfc3987.match(iri, "IRI")) is valid
@@ -0,0 +1,84 @@
+import pytest
+
+from podping_hivewriter.node_selector import NodeSelector
+
+
+def test_ties_keep_node_order():
+    node_selector = NodeSelector(["a", "b", "c"])
+    assert node_selector.current_node == "a"
+
+    for node in ("c", "b", "a"):
+        node_selector.record_latency(node, 0.1)
+    assert node_selector.current_node == "a"
+
+
+def test_ranks_by_latency():
+    node_selector = NodeSelector(["a", "b", "c"])
+    node_selector.record_latency("a", 0.3)
+    node_selector.record_latency("b", 0.1)
+    node_selector.record_latency("c", 0.2)
+
+    assert node_selector.current_node == "b"
+
+
+def test_failure_outweighs_latency():
+    node_selector = NodeSelector(["fast", "slow"])
+    node_selector.record_latency("fast", 0.05)
+    node_selector.record_latency("slow", 0.9)
+
+    node_selector.record_failure("fast")
+    assert node_selector.current_node == "slow"
+
+    # However slow the other node gets
+    node_selector.record_latency("slow", 30)
+    assert node_selector.current_node == "slow"
+
+    # Failures are consecutive, a successful broadcast clears them
+    node_selector.record_success("fast")
+    assert node_selector.stats("fast").failure_count == 0
+    assert node_selector.current_node == "fast"
+
+
+def test_failures_rotate_through_nodes():
+    node_selector = NodeSelector(["a", "b", "c"])
+
+    tried = []
+    for _ in range(4):
+        tried.append(node_selector.current_node)
+        node_selector.record_failure(node_selector.current_node)
+
+    assert tried == ["a", "b", "c", "a"]
+
+
+def test_latency_moving_average():
+    node_selector = NodeSelector(["a"], latency_weight=0.5)
+
+    node_selector.record_latency("a", 0.1)
+    assert node_selector.stats("a").latency_ms == pytest.approx(100)
+
+    node_selector.record_latency("a", 0.3)
+    assert node_selector.stats("a").latency_ms == pytest.approx(200)
+
+
+def test_health_check_keeps_broadcast_failures():
+    node_selector = NodeSelector(["a", "b"])
+    node_selector.record_failure("a")
+
+    # a answers health checks faster, but still failed its last broadcast
+    node_selector.record_latency("a", 0.05)
+    node_selector.record_latency("b", 0.5)
+
+    assert node_selector.stats("a").failure_count == 1
+    assert node_selector.current_node == "b"
+
+
+def test_failed_health_check_clears_on_next_check():
+    node_selector = NodeSelector(["a", "b"])
+    node_selector.record_latency("a", 0.05)
+    node_selector.record_latency("b", 0.5)
+
+    node_selector.record_check_failure("a")
+    assert node_selector.current_node == "b"
+
+    node_selector.record_latency("a", 0.05)
+    assert node_selector.current_node == "a"
@@ -0,0 +1,40 @@
+import asyncio
+
+import pytest
+
+
+@pytest.mark.asyncio
+@pytest.mark.timeout(30)
+async def test_iri_counted_while_waiting_for_queue_room(make_podping_hivewriter):
+    podping_hivewriter = await make_podping_hivewriter(max_queue_depth=1)
+
+    assert await podping_hivewriter._receive_iri("https://example.com/a.xml") == "OK"
+    waiting = asyncio.create_task(
+        podping_hivewriter._receive_iri("https://example.com/b.xml")
+    )
+    await asyncio.sleep(0)
+    assert not waiting.done()
+    assert podping_hivewriter.num_operations_in_queue == 2
+
+    # What the batch loop does, the waiting IRI then gets the room
+    assert podping_hivewriter.iri_queue.get_nowait() == "https://example.com/a.xml"
+    assert await waiting == "OK"
+
+    assert podping_hivewriter.num_operations_in_queue == 2
+    assert podping_hivewriter.total_iris_recv == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.timeout(30)
+async def test_busy_is_not_counted(make_podping_hivewriter, monkeypatch):
+    monkeypatch.setattr(
+        "podping_hivewriter.podping_hivewriter.IRI_QUEUE_FULL_TIMEOUT", 0.05
+    )
+    podping_hivewriter = await make_podping_hivewriter(max_queue_depth=1)
+
+    assert await podping_hivewriter._receive_iri("https://example.com/a.xml") == "OK"
+    assert await podping_hivewriter._receive_iri("https://example.com/b.xml") == "Busy"
+
+    assert podping_hivewriter.num_operations_in_queue == 1
+    assert podping_hivewriter.total_iris_recv == 1
+    assert podping_hivewriter.iri_queue.qsize() == 1
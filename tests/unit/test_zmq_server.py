@@ -0,0 +1,85 @@
+import asyncio
+import socket
+
+import pytest
+import zmq
+import zmq.asyncio
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+async def start_zmq_server(make_podping_hivewriter, monkeypatch, timeout):
+    """Serve ZeroMQ requests into a one IRI queue that nothing drains"""
+    monkeypatch.setattr(
+        "podping_hivewriter.podping_hivewriter.IRI_QUEUE_FULL_TIMEOUT", timeout
+    )
+    podping_hivewriter = await make_podping_hivewriter(max_queue_depth=1)
+    podping_hivewriter.listen_port = free_port()
+    podping_hivewriter._add_task(
+        asyncio.create_task(podping_hivewriter._zmq_response_loop())
+    )
+    return podping_hivewriter
+
+
+@pytest.fixture
+def zmq_context():
+    context = zmq.asyncio.Context()
+    yield context
+    context.destroy(linger=0)
+
+
+def req_socket(zmq_context, podping_hivewriter):
+    req = zmq_context.socket(zmq.REQ)
+    req.connect(
+        f"tcp://{podping_hivewriter.listen_ip}:{podping_hivewriter.listen_port}"
+    )
+    return req
+
+
+async def request(req, message: bytes) -> str:
+    await req.send(message)
+    return await asyncio.wait_for(req.recv_string(), 5)
+
+
+@pytest.mark.asyncio
+@pytest.mark.timeout(30)
+async def test_replies_to_req_client(make_podping_hivewriter, monkeypatch, zmq_context):
+    podping_hivewriter = await start_zmq_server(
+        make_podping_hivewriter, monkeypatch, timeout=0.05
+    )
+    req = req_socket(zmq_context, podping_hivewriter)
+
+    assert await request(req, b"https://example.com/a.xml") == "OK"
+    assert await request(req, b"not an iri") == "Invalid IRI"
+    assert await request(req, b"https://example.com/\xff\xfe.xml") == "Invalid IRI"
+    # The queue only has room for one IRI
+    assert await request(req, b"https://example.com/b.xml") == "Busy"
+
+    assert podping_hivewriter.iri_queue.get_nowait() == "https://example.com/a.xml"
+    assert podping_hivewriter.num_operations_in_queue == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.timeout(30)
+async def test_routes_replies_while_a_request_waits(
+    make_podping_hivewriter, monkeypatch, zmq_context
+):
+    podping_hivewriter = await start_zmq_server(
+        make_podping_hivewriter, monkeypatch, timeout=1
+    )
+    waiting_req = req_socket(zmq_context, podping_hivewriter)
+    other_req = req_socket(zmq_context, podping_hivewriter)
+
+    assert await request(waiting_req, b"https://example.com/a.xml") == "OK"
+
+    # Waits for queue room, the other client is answered meanwhile
+    waiting = asyncio.create_task(request(waiting_req, b"https://example.com/b.xml"))
+    await asyncio.sleep(0.1)
+    assert await request(other_req, b"not an iri") == "Invalid IRI"
+    assert not waiting.done()
+
+    assert await waiting == "Busy"